@@ -1,45 +1,191 @@
 import sys
 import os
+import atexit
+import copy
 import json
+import logging
+import re
+import stat
 import subprocess
-import time
 import threading
 import socket
+from contextlib import contextmanager
+from functools import partial
+from urllib.parse import quote_plus
+
+# Set before any Qt module is imported so the rules apply from the start
+os.environ['QT_LOGGING_RULES'] = 'qt.qpa.fonts.debug=false;js.debug=false'
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QPushButton,
-    QVBoxLayout, QHBoxLayout, QLineEdit, QTabBar, QStackedLayout,
+    QVBoxLayout, QHBoxLayout, QGridLayout, QLineEdit, QTabBar, QStackedWidget,
     QSizePolicy, QComboBox, QDialog, QFormLayout, QDialogButtonBox,
-    QMessageBox, QCheckBox, QFileDialog, QSpinBox, QSlider, QGroupBox, QScrollArea
+    QMessageBox, QCheckBox, QFileDialog, QSlider, QGroupBox, QScrollArea,
+    QTabWidget
+)
+from PyQt5.QtCore import (
+    Qt, QUrl, QTimer, QDeadlineTimer, QByteArray, pyqtSignal, QObject, QRunnable, QThreadPool
 )
-from PyQt5.QtCore import Qt, QUrl, pyqtSignal, QObject, QThread
-from PyQt5.QtGui import QIcon, QPixmap
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineProfile, QWebEnginePage
-from PyQt5.QtNetwork import QNetworkProxy, QNetworkProxyFactory
+from PyQt5.QtGui import QIcon, QPixmap, QColor
+from PyQt5.QtNetwork import QNetworkProxy, QNetworkProxyFactory, QTcpSocket, QAbstractSocket
+
+try:
+    import orjson
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+else:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+logger = logging.getLogger("cyberbrowser")
+logger.addHandler(logging.NullHandler())
+
+_QSS = None
+
+ASSET_LOGO = "assets/CyberBrowser.png"
+_LOGO_EXISTS = os.path.isfile(ASSET_LOGO)
+
+_webengine = None
+
+_URL_RE = re.compile(r'^(?:https?://(?P<host>[^/\s]*)\S*|(?P<bare>[^\s.]*)\.\S+)$')
+_ONION_RE = re.compile(r'\.onion(?:[:/]|$)', re.IGNORECASE)
+_PAGE_BACKGROUND = QColor('#0f172a')
+_WEBVIEW_POOL_SIZE = 4
+_WEBVIEW_REFILL_DELAY = 1000
+_DEFAULT_SEARCH_URL = "https://www.google.com/search?q={}"
+_PROBE_INITIAL_DELAY = 25
+_PROBE_MAX_DELAY = 500
+_TOR_STOP_GRACE = 10000
+_BOOTSTRAP_RE = re.compile(r'BOOTSTRAP PROGRESS=(\d+)')
+# Keep Tor out of the browser's console session so Ctrl-C does not kill it
+_POPEN_KWARGS = ({"creationflags": subprocess.CREATE_NO_WINDOW} if os.name == 'nt'
+                 else {"start_new_session": True})
+
+_ALIGN_CENTER = Qt.AlignCenter
+_ALIGN_LEFT = Qt.AlignLeft
+_ALIGN_RIGHT = Qt.AlignRight
+_KEEP_AR = Qt.KeepAspectRatio
+_SMOOTH = Qt.SmoothTransformation
+_SP_FIXED = QSizePolicy.Fixed
+
+
+def load_stylesheet():
+    """Read the application stylesheet once and reuse it afterwards"""
+    global _QSS
+    if _QSS is None:
+        try:
+            with open("assets/cyberbrowser.qss", 'r', encoding='utf-8') as f:
+                _QSS = f.read()
+        except IOError as e:
+            logger.warning("Error loading stylesheet: %s", e)
+            _QSS = ""
+    return _QSS
 
-os.environ['QT_LOGGING_RULES'] = 'qt.qpa.fonts.debug=false'
 
+def configure_webengine():
+    """Set the Chromium flags QtWebEngine reads when it starts up"""
+    if os.name == 'nt':
+        os.environ.setdefault(
+            'QTWEBENGINE_CHROMIUM_FLAGS',
+            '--enable-gpu-rasterization --ignore-gpu-blocklist'
+        )
 
-class TorProxyFactory(QNetworkProxyFactory):
-    """Custom proxy factory for Tor"""
-    
-    def __init__(self, use_tor=False):
+
+def load_webengine():
+    """Import the QtWebEngine backed classes on first use"""
+    global _webengine
+    if _webengine is None:
+        configure_webengine()
+        import webengine
+        _webengine = webengine
+    return _webengine
+
+
+def plain_label(text, object_name=""):
+    """Create a QLabel that skips Qt's rich text detection"""
+    label = QLabel()
+    label.setTextFormat(Qt.PlainText)
+    label.setWordWrap(False)
+    label.setObjectName(object_name)
+    label.setText(text)
+    return label
+
+
+@contextmanager
+def updates_suspended(widget):
+    """Repaint widget once after a batch of changes instead of per change"""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+        widget.update()
+
+
+class TorLauncherSignals(QObject):
+    launched = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class TorLauncher(QRunnable):
+    """Spawn the Tor process on a pool thread so fork/exec never stalls the GUI"""
+
+    def __init__(self, command, data_dir, signals):
         super().__init__()
-        self.use_tor = use_tor
-    
-    def queryProxy(self, query):
-        if self.use_tor:
-            proxy = QNetworkProxy()
-            proxy.setType(QNetworkProxy.Socks5Proxy)
-            proxy.setHostName("127.0.0.1")
-            proxy.setPort(9050)
-            return [proxy]
+        self.command = command
+        self.data_dir = data_dir
+        self.signals = signals
+
+    def run(self):
+        try:
+            os.makedirs(self.data_dir, exist_ok=True)
+            process = subprocess.Popen(
+                self.command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                **_POPEN_KWARGS
+            )
+        except Exception as e:
+            self.signals.failed.emit(str(e))
         else:
-            return [QNetworkProxy(QNetworkProxy.NoProxy)]
+            self.signals.launched.emit(process)
+
+
+class TorConnectionTestSignals(QObject):
+    finished = pyqtSignal(bool)
+
+
+class TorConnectionTest(QRunnable):
+    """Check that Tor's SOCKS port answers a SOCKS5 greeting, on a pool thread"""
+
+    def __init__(self, port, signals):
+        super().__init__()
+        self.port = port
+        self.signals = signals
+
+    def run(self):
+        try:
+            with socket.create_connection(("127.0.0.1", self.port), timeout=0.5) as sock:
+                # Version 5, one method offered: no authentication
+                sock.sendall(b"\x05\x01\x00")
+                ok = sock.recv(2) == b"\x05\x00"
+        except OSError as e:
+            logger.warning("Tor connection test failed: %s", e)
+            ok = False
+        self.signals.finished.emit(ok)
 
 
 class TorManager(QObject):
     """Manages Tor process and connection"""
     tor_status_changed = pyqtSignal(bool, str) 
+    tor_start_failed = pyqtSignal(str)
+    # Emitted from the output drain thread when Tor closes its output
+    _tor_exited = pyqtSignal(object)
     
     def __init__(self, config_manager):
         super().__init__()
@@ -48,103 +194,241 @@ class TorManager(QObject):
         self.tor_port = 9050  
         self.control_port = 9051  
         self.is_running = False
+        self.is_starting = False
+        self.startup_timeout = 30
+        self._startup_timer = QTimer(self)
+        self._startup_timer.setSingleShot(True)
+        self._startup_timer.timeout.connect(self._on_startup_timeout)
+        self._data_dir = None
+        self.bootstrap_progress = 0
+        self._probe = None
+        self._probe_delay = _PROBE_INITIAL_DELAY
+        self._launcher_signals = TorLauncherSignals(self)
+        self._launcher_signals.launched.connect(self._on_tor_launched)
+        self._launcher_signals.failed.connect(self._on_tor_launch_failed)
+        self._tor_exited.connect(self._on_tor_exited)
+        # Stopped processes still exiting, as (process, kill deadline)
+        self._stopping = []
+        self._reap_timer = QTimer(self)
+        self._reap_timer.setInterval(100)
+        self._reap_timer.timeout.connect(self._reap_stopped)
         
     def start_tor(self):
-        """Start Tor process"""
-        if self.is_running:
+        """Launch Tor and report readiness later through tor_status_changed"""
+        if self.is_running or self.is_starting:
             return True
             
-        tor_dir = self.config_manager.get("tor_directory", "")
-        if not tor_dir:
+        if not self.config_manager.get("tor_directory", ""):
             self.tor_status_changed.emit(False, "Tor directory not configured")
             return False
             
-        tor_executable = None
-        for exe in ["tor", "tor.exe"]:
-            tor_path = os.path.join(tor_dir, exe)
-            if os.path.isfile(tor_path) and os.access(tor_path, os.X_OK):
-                tor_executable = tor_path
-                break
-                
+        tor_executable = self.config_manager.find_tor_executable()
         if not tor_executable:
             self.tor_status_changed.emit(False, "Tor executable not found")
             return False
             
+        tor_data_dir = os.path.join(os.path.expanduser("~"), ".cyberbrowser_tor")
+        tor_config = [
+            tor_executable,
+            "--SocksPort", f"127.0.0.1:{self.tor_port}",
+            "--ControlPort", f"127.0.0.1:{self.control_port}",
+            "--DataDirectory", tor_data_dir,
+            "--Log", "notice stdout",
+            "--CookieAuthentication", "1",
+            "--ExitRelay", "0"
+        ]
+
+        self.is_starting = True
+        self.bootstrap_progress = 0
+        self._data_dir = tor_data_dir
+        self.tor_status_changed.emit(False, "Tor is starting...")
+        QThreadPool.globalInstance().start(TorLauncher(tor_config, tor_data_dir, self._launcher_signals))
+        return True
+
+    def _on_tor_launched(self, process):
+        if not self.is_starting:
+            # stop_tor() ran while the process was being spawned
+            process.terminate()
+            return
+        self.tor_process = process
+        threading.Thread(target=self._drain_output, args=(process,), daemon=True).start()
+        self._startup_timer.start(self.startup_timeout * 1000)
+        self._probe_delay = _PROBE_INITIAL_DELAY
+        QTimer.singleShot(self._probe_delay, self._probe_control_port)
+
+    def _drain_output(self, process):
+        """Keep reading Tor's output so a full pipe never blocks its logging"""
+        with process.stdout as stream:
+            for line in iter(stream.readline, b''):
+                logger.debug("tor: %s", line.decode(errors='replace').rstrip())
         try:
-            tor_data_dir = os.path.join(os.path.expanduser("~"), ".cyberbrowser_tor")
-            os.makedirs(tor_data_dir, exist_ok=True)
-            
-            tor_config = [
-                tor_executable,
-                "--SocksPort", f"127.0.0.1:{self.tor_port}",
-                "--ControlPort", f"127.0.0.1:{self.control_port}",
-                "--DataDirectory", tor_data_dir,
-                "--Log", "notice stdout",
-                "--CookieAuthentication", "1",
-                "--ExitRelay", "0"
-            ]
-            
-            self.tor_process = subprocess.Popen(
-                tor_config,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-            )
-            
-            if self._wait_for_tor_connection():
-                self.is_running = True
-                self.tor_status_changed.emit(True, "Tor is running")
-                return True
-            else:
-                self.stop_tor()
-                self.tor_status_changed.emit(False, "Tor failed to start")
-                return False
-                
-        except Exception as e:
-            self.tor_status_changed.emit(False, f"Failed to start Tor: {str(e)}")
-            return False
+            self._tor_exited.emit(process)
+        except RuntimeError:
+            # The manager was destroyed at shutdown, after stopping Tor
+            pass
+
+    def _on_tor_exited(self, process):
+        if process is not self.tor_process:
+            # stop_tor() already took care of it
+            return
+        if self.is_starting:
+            self._startup_failed("Tor exited during startup")
+            return
+        logger.warning("Tor exited unexpectedly")
+        self.tor_process = None
+        self.is_running = False
+        self.bootstrap_progress = 0
+        self._discard_probe()
+        self.tor_status_changed.emit(False, "Tor exited unexpectedly")
+
+    def _on_tor_launch_failed(self, message):
+        if not self.is_starting:
+            return
+        self.is_starting = False
+        message = f"Failed to start Tor: {message}"
+        self.tor_status_changed.emit(False, message)
+        self.tor_start_failed.emit(message)
             
     def stop_tor(self):
-        """Stop Tor process"""
+        """Stop Tor process without waiting for it; it is reaped in the background"""
         if self.tor_process:
+            process, self.tor_process = self.tor_process, None
             try:
-                self.tor_process.terminate()
-                self.tor_process.wait(timeout=10)
-            except subprocess.TimeoutExpired:
-                self.tor_process.kill()
-            except Exception:
+                process.terminate()
+            except OSError:
                 pass
-            finally:
-                self.tor_process = None
-                
+            self._stopping.append((process, QDeadlineTimer(_TOR_STOP_GRACE)))
+            self._reap_timer.start()
+
         self.is_running = False
+        self.is_starting = False
+        self._startup_timer.stop()
+        self._discard_probe()
         self.tor_status_changed.emit(False, "Tor stopped")
-        
-    def _wait_for_tor_connection(self, timeout=30):
-        """Wait for Tor SOCKS proxy to become available"""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+
+    def _reap_stopped(self):
+        """Collect stopped Tor processes, killing any that outlive the grace period"""
+        still_running = []
+        for process, deadline in self._stopping:
+            if process.poll() is not None:
+                continue
+            if deadline.hasExpired():
+                process.kill()
+            still_running.append((process, deadline))
+        self._stopping = still_running
+        if not still_running:
+            self._reap_timer.stop()
+
+    def wait_for_stop(self):
+        """Block until stopped Tor processes have exited; used at shutdown"""
+        self._reap_timer.stop()
+        for process, deadline in self._stopping:
             try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex(('127.0.0.1', self.tor_port))
-                sock.close()
-                if result == 0:
-                    return True
-            except Exception:
-                pass
-            time.sleep(1)
-        return False
+                process.wait(timeout=max(0, deadline.remainingTime()) / 1000)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        self._stopping = []
+
+    def _probe_control_port(self):
+        """Connect to the control port and wait for Tor to report bootstrap done"""
+        if not self.is_starting or self._probe is not None:
+            return
+        if self.tor_process is None or self.tor_process.poll() is not None:
+            self._startup_failed("Tor exited during startup")
+            return
+
+        self._probe = QTcpSocket(self)
+        self._probe.connected.connect(self._on_control_connected)
+        self._probe.readyRead.connect(self._on_control_ready_read)
+        # errorOccurred replaced the error signal in Qt 5.15
+        error_signal = getattr(self._probe, 'errorOccurred', None) or self._probe.error
+        error_signal.connect(self._on_probe_error)
+        self._probe.connectToHost("127.0.0.1", self.control_port)
+
+    def _on_control_connected(self):
+        if self.sender() is not self._probe:
+            return
+        self._probe.setSocketOption(QAbstractSocket.LowDelayOption, 1)
+        try:
+            with open(os.path.join(self._data_dir, "control_auth_cookie"), 'rb') as f:
+                cookie = f.read().hex()
+        except OSError:
+            cookie = ""
+        self._probe.write(
+            f"AUTHENTICATE {cookie}\r\n"
+            "SETEVENTS STATUS_CLIENT\r\n"
+            "GETINFO status/bootstrap-phase\r\n".encode('ascii')
+        )
+
+    def _on_control_ready_read(self):
+        probe = self.sender()
+        if probe is not self._probe:
+            return
+        while probe.canReadLine():
+            line = bytes(probe.readLine()).decode('ascii', errors='replace')
+            match = _BOOTSTRAP_RE.search(line)
+            if match:
+                progress = int(match.group(1))
+                if progress >= 100:
+                    self._on_tor_ready()
+                    return
+                if progress > self.bootstrap_progress:
+                    self.bootstrap_progress = progress
+                    # Only give up on a Tor that stops making progress
+                    self._startup_timer.start(self.startup_timeout * 1000)
+                    self.tor_status_changed.emit(False, f"Tor is starting... {progress}%")
+                continue
+            if line.startswith("250 OK"):
+                # Tor is up and answering; the timeout now bounds bootstrapping
+                self._startup_timer.start(self.startup_timeout * 1000)
+                continue
+            if line.startswith("515"):
+                # The cookie is missing or stale, or another Tor owns the control port
+                logger.warning("Tor control authentication failed: %s", line.strip())
+                self._retry_probe()
+                return
+
+    def _on_tor_ready(self):
+        self._startup_timer.stop()
+        self._discard_probe()
+        self.is_starting = False
+        self.is_running = True
+        self.bootstrap_progress = 100
+        self.tor_status_changed.emit(True, "Tor is running")
+
+    def _on_probe_error(self, error):
+        if self.sender() is not self._probe:
+            return
+        self._retry_probe()
+
+    def _retry_probe(self):
+        """Drop the control connection and try again after a growing delay"""
+        self._discard_probe()
+        QTimer.singleShot(self._probe_delay, self._probe_control_port)
+        self._probe_delay = min(_PROBE_MAX_DELAY, self._probe_delay * 3 // 2)
+
+    def _on_startup_timeout(self):
+        if self.is_starting:
+            self._startup_failed("Tor failed to start")
+
+    def _discard_probe(self):
+        probe, self._probe = self._probe, None
+        if probe is not None:
+            probe.abort()
+            probe.deleteLater()
+
+    def _startup_failed(self, message):
+        self.stop_tor()
+        self.tor_status_changed.emit(False, message)
+        self.tor_start_failed.emit(message)
         
     def is_tor_running(self):
         """Check if Tor is currently running"""
         return self.is_running and self.tor_process and self.tor_process.poll() is None
 
 
-class ConfigManager:
-    def __init__(self):
-        self.config_file = "cyberbrowser_config.json"
-        self.default_config = {
+_DEFAULT_CONFIG = {
     "default_search_engine": "Google",
     "search_engines": {
         "Google": "https://www.google.com/search?q={}",
@@ -162,6 +446,7 @@ class ConfigManager:
     "tor_directory": "",
     "window_width": 1400,
     "window_height": 900,
+    "window_geometry": "",
     "enable_javascript": True,
     "enable_plugins": True,
     "enable_images": True,
@@ -174,107 +459,160 @@ class ConfigManager:
     "clear_data_on_exit": False,
     "enable_spell_check": True
 }
+
+
+class ConfigManager:
+    __slots__ = ('config_file', 'config', 'search_engines',
+                 '_tor_executable_cache', '_dirty', '_flush_timer', '_saved_data',
+                 '__weakref__')
+
+    _cache = {}
+
+    def __init__(self):
+        self.config_file = "cyberbrowser_config.json"
+        self._saved_data = None
         self.config = self.load_config()
+        self.search_engines = self.config.get("search_engines", {})
+        self._tor_executable_cache = {}
+
+        self._dirty = False
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+        # The timer may already be gone at interpreter exit, so skip it there
+        atexit.register(self._write_if_dirty)
 
     def load_config(self):
-        if os.path.exists(self.config_file):
+        try:
+            mtime = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            self.save_config(_DEFAULT_CONFIG)
+            return copy.deepcopy(_DEFAULT_CONFIG)
+
+        key = (self.config_file, mtime)
+        cached = ConfigManager._cache.get(key)
+        if cached is None:
             try:
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-
-                config = self.default_config.copy()
-                config.update(loaded_config)
-                return config
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                loaded_config = _json_loads(data)
             except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading config: {e}. Using defaults.")
-                return self.default_config.copy()
-        else:
-            self.save_config(self.default_config)
-            return self.default_config.copy()
+                logger.warning("Error loading config: %s. Using defaults.", e)
+                return copy.deepcopy(_DEFAULT_CONFIG)
+
+            cached = ConfigManager._cache[key] = ({**_DEFAULT_CONFIG, **loaded_config}, data)
+        config, self._saved_data = cached
+        return copy.deepcopy(config)
 
     def save_config(self, config=None):
         if config is None:
             config = self.config
+        data = _json_dumps(config)
+        if data == self._saved_data:
+            return
+        tmp_file = self.config_file + '.tmp'
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=4)
-        except IOError as e:
-            print(f"Error saving config: {e}")
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
+        except OSError as e:
+            logger.warning("Error saving config: %s", e)
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            return
+        self._saved_data = data
+        for key in [k for k in ConfigManager._cache if k[0] == self.config_file]:
+            del ConfigManager._cache[key]
 
     def get(self, key, default=None):
         return self.config.get(key, default)
 
     def set(self, key, value):
         self.config[key] = value
-        self.save_config()
+        if key == "search_engines":
+            self.search_engines = value
+        elif key == "tor_directory":
+            self._tor_executable_cache.clear()
+        self._schedule_flush()
+
+    def update(self, settings):
+        """Apply several settings at once with a single deferred write"""
+        self.config.update(settings)
+        if "search_engines" in settings:
+            self.search_engines = settings["search_engines"]
+        if "tor_directory" in settings:
+            self._tor_executable_cache.clear()
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        self._dirty = True
+        self._flush_timer.start(250)
+
+    def flush(self):
+        """Write pending changes to disk now"""
+        self._flush_timer.stop()
+        self._write_if_dirty()
+
+    def _write_if_dirty(self):
+        if self._dirty:
+            self._dirty = False
+            self.save_config()
 
     def get_search_url(self, engine_name, query):
-        search_engines = self.config.get("search_engines", {})
-        if engine_name in search_engines:
-            return search_engines[engine_name].format(query.replace(" ", "+"))
-        
-        return f"https://www.google.com/search?q={query.replace(' ', '+')}"
+        template = self.search_engines.get(engine_name, _DEFAULT_SEARCH_URL)
+        return template.format(quote_plus(query))
 
-    def is_tor_available(self):
-        """Check if Tor is available at the configured directory"""
-        tor_dir = self.get("tor_directory", "")
-        if not tor_dir:
-            return False
-        
-        tor_executables = ["tor", "tor.exe"]
-        for exe in tor_executables:
-            tor_path = os.path.join(tor_dir, exe)
-            if os.path.isfile(tor_path) and os.access(tor_path, os.X_OK):
-                return True
-        return False
+    def find_tor_executable(self):
+        """Return the Tor executable in the configured directory, or None"""
+        return self.locate_tor_executable(self.get("tor_directory", ""))
 
+    def locate_tor_executable(self, tor_dir, refresh=False):
+        """Return the Tor executable inside tor_dir, or None
 
-class TorWebEngineProfile(QWebEngineProfile):
-    """Custom web engine profile that uses Tor proxy"""
-    
-    def __init__(self, tor_enabled=False, parent=None):
-        super().__init__(parent)
-        self.tor_enabled = tor_enabled
-        self.proxy_factory = None
-        self.setup_profile()
-        
-    def setup_profile(self):
-        if self.tor_enabled:
+        refresh skips the cache and re-checks the directory.
+        """
+        if not tor_dir:
+            return None
+        if not refresh:
+            tor_executable = self._tor_executable_cache.get(tor_dir)
+            if tor_executable is not None:
+                return tor_executable
 
-            self.proxy_factory = TorProxyFactory(use_tor=True)
-            
-            self.setHttpUserAgent("Mozilla/5.0 (Windows NT 10.0; rv:91.0) Gecko/20100101 Firefox/91.0")
-            
-            self.setPersistentCookiesPolicy(QWebEngineProfile.NoPersistentCookies)
-            self.setHttpCacheType(QWebEngineProfile.MemoryHttpCache)
-            self.setHttpCacheMaximumSize(0)
-            
-            QNetworkProxyFactory.setApplicationProxyFactory(self.proxy_factory)
+        tor_executable = None
+        for exe in ("tor", "tor.exe"):
+            tor_path = os.path.join(tor_dir, exe)
+            try:
+                mode = os.stat(tor_path).st_mode
+            except OSError:
+                continue
+            # Windows has no execute bits; any regular tor.exe will do there
+            if stat.S_ISREG(mode) and (os.name == 'nt' or mode & 0o111):
+                tor_executable = tor_path
+                break
+        # Misses are not cached so a Tor unpacked into tor_dir later is found
+        if tor_executable is not None:
+            self._tor_executable_cache[tor_dir] = tor_executable
         else:
+            self._tor_executable_cache.pop(tor_dir, None)
+        return tor_executable
 
-            self.setHttpUserAgent("")
-            self.setPersistentCookiesPolicy(QWebEngineProfile.AllowPersistentCookies)
-            self.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
-            
-            QNetworkProxyFactory.setUseSystemConfiguration(True)
-    
-        self.apply_config_settings()
-
-def apply_config_settings(self):
-    """Apply settings from config manager"""
-    if hasattr(self, 'config_manager'):
-        config = self.config_manager
-        
-        download_dir = config.get("download_directory", "")
-        if download_dir and os.path.exists(download_dir):
-            self.setDownloadPath(download_dir)
-        
-        custom_ua = config.get("user_agent", "")
-        if custom_ua and not self.tor_enabled:
-            self.setHttpUserAgent(custom_ua)
-        
-        if not config.get("enable_cookies", True):
-            self.setPersistentCookiesPolicy(QWebEngineProfile.NoPersistentCookies)
+    def is_tor_available(self):
+        """Check if Tor is available at the configured directory"""
+        return self.find_tor_executable() is not None
+
+
+# (attribute, label, config key, default) for each Privacy & Security checkbox
+_PRIVACY_CHECKBOXES = (
+    ("enable_cookies_cb", "Enable Cookies:", "enable_cookies", True),
+    ("enable_javascript_cb", "Enable JavaScript:", "enable_javascript", True),
+    ("enable_images_cb", "Load Images:", "enable_images", True),
+    ("enable_plugins_cb", "Enable Plugins:", "enable_plugins", True),
+    ("enable_popup_blocking_cb", "Block Popups:", "enable_popup_blocking", True),
+    ("enable_notifications_cb", "Enable Notifications:", "enable_notifications", False),
+    ("clear_data_on_exit_cb", "Clear Data on Exit:", "clear_data_on_exit", False),
+)
 
 
 class SettingsDialog(QDialog):
@@ -285,6 +623,13 @@ class SettingsDialog(QDialog):
         self.setModal(True)
         self.resize(700, 750)
         self.setMinimumSize(900, 700)
+
+        self._tor_status_timer = QTimer(self)
+        self._tor_status_timer.setSingleShot(True)
+        self._tor_status_timer.setInterval(250)
+        self._tor_status_timer.timeout.connect(self.update_tor_status)
+        self._tor_status_dir = None
+
         self.init_ui()
 
     def init_ui(self):
@@ -292,21 +637,22 @@ class SettingsDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
         
-        from PyQt5.QtWidgets import QTabWidget, QScrollArea
         tab_widget = QTabWidget()
         
         general_tab = self.create_general_tab()
         tab_widget.addTab(general_tab, "General")
         
-        privacy_tab = self.create_privacy_tab()
-        tab_widget.addTab(privacy_tab, "Privacy & Security")
-        
-        advanced_tab = self.create_advanced_tab()
-        tab_widget.addTab(advanced_tab, "Advanced")
-        
-        
-        tor_tab = self.create_tor_tab()
-        tab_widget.addTab(tor_tab, "Tor")
+        # The other tabs are built the first time they are shown
+        self._tab_builders = {}
+        for builder, title in ((self.create_privacy_tab, "Privacy & Security"),
+                               (self.create_advanced_tab, "Advanced"),
+                               (self.create_tor_tab, "Tor")):
+            page = QWidget()
+            page_layout = QVBoxLayout(page)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+            self._tab_builders[tab_widget.addTab(page, title)] = builder
+        tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self.tab_widget = tab_widget
         
         layout.addWidget(tab_widget)
         
@@ -316,8 +662,16 @@ class SettingsDialog(QDialog):
         button_box.rejected.connect(self.reject)
         button_box.button(QDialogButtonBox.RestoreDefaults).clicked.connect(self.restore_defaults)
         layout.addWidget(button_box)
-        
-        self.setStyleSheet(self.get_dialog_stylesheet())
+
+    def _ensure_tab_built(self, index):
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            # The dialog is already visible here, so paint the new tab once
+            with updates_suspended(self.tab_widget):
+                self.tab_widget.widget(index).layout().addWidget(builder())
+
+    def _is_built(self, builder):
+        return builder not in self._tab_builders.values()
 
     def create_general_tab(self):
         scroll = QScrollArea()
@@ -336,8 +690,8 @@ class SettingsDialog(QDialog):
         
         self.search_engine_combo = QComboBox()
         self.search_engine_combo.setMinimumHeight(40)
-        search_engines = self.config_manager.get("search_engines", {})
-        self.search_engine_combo.addItems(search_engines.keys())
+        search_engines = self.config_manager.search_engines
+        self.search_engine_combo.addItems(list(search_engines))
         current_engine = self.config_manager.get("default_search_engine", "Google")
         if current_engine in search_engines:
             self.search_engine_combo.setCurrentText(current_engine)
@@ -417,40 +771,12 @@ class SettingsDialog(QDialog):
         privacy_layout.setSpacing(15)
         privacy_layout.setContentsMargins(20, 25, 20, 20)
         
-        self.enable_cookies_cb = QCheckBox()
-        self.enable_cookies_cb.setMinimumHeight(25)
-        self.enable_cookies_cb.setChecked(self.config_manager.get("enable_cookies", True))
-        privacy_layout.addRow("Enable Cookies:", self.enable_cookies_cb)
-        
-        self.enable_javascript_cb = QCheckBox()
-        self.enable_javascript_cb.setMinimumHeight(25)
-        self.enable_javascript_cb.setChecked(self.config_manager.get("enable_javascript", True))
-        privacy_layout.addRow("Enable JavaScript:", self.enable_javascript_cb)
-        
-        self.enable_images_cb = QCheckBox()
-        self.enable_images_cb.setMinimumHeight(25)
-        self.enable_images_cb.setChecked(self.config_manager.get("enable_images", True))
-        privacy_layout.addRow("Load Images:", self.enable_images_cb)
-        
-        self.enable_plugins_cb = QCheckBox()
-        self.enable_plugins_cb.setMinimumHeight(25)
-        self.enable_plugins_cb.setChecked(self.config_manager.get("enable_plugins", True))
-        privacy_layout.addRow("Enable Plugins:", self.enable_plugins_cb)
-        
-        self.enable_popup_blocking_cb = QCheckBox()
-        self.enable_popup_blocking_cb.setMinimumHeight(25)
-        self.enable_popup_blocking_cb.setChecked(self.config_manager.get("enable_popup_blocking", True))
-        privacy_layout.addRow("Block Popups:", self.enable_popup_blocking_cb)
-        
-        self.enable_notifications_cb = QCheckBox()
-        self.enable_notifications_cb.setMinimumHeight(25)
-        self.enable_notifications_cb.setChecked(self.config_manager.get("enable_notifications", False))
-        privacy_layout.addRow("Enable Notifications:", self.enable_notifications_cb)
-        
-        self.clear_data_on_exit_cb = QCheckBox()
-        self.clear_data_on_exit_cb.setMinimumHeight(25)
-        self.clear_data_on_exit_cb.setChecked(self.config_manager.get("clear_data_on_exit", False))
-        privacy_layout.addRow("Clear Data on Exit:", self.clear_data_on_exit_cb)
+        for attr, label, key, default in _PRIVACY_CHECKBOXES:
+            checkbox = QCheckBox()
+            checkbox.setMinimumHeight(25)
+            checkbox.setChecked(self.config_manager.get(key, default))
+            setattr(self, attr, checkbox)
+            privacy_layout.addRow(label, checkbox)
         
         layout.addWidget(privacy_group)
         
@@ -554,6 +880,7 @@ class SettingsDialog(QDialog):
         tor_layout.addRow("Tor Directory:", tor_dir_layout)
         
         self.tor_status_label = QLabel()
+        self.tor_status_label.setObjectName("tor_status_label")
         self.tor_status_label.setMinimumHeight(25)
         self.update_tor_status()
         tor_layout.addRow("Tor Status:", self.tor_status_label)
@@ -579,7 +906,7 @@ class SettingsDialog(QDialog):
         
         layout.addWidget(instructions_group)
         
-        self.tor_directory_input.textChanged.connect(self.update_tor_status)
+        self.tor_directory_input.textChanged.connect(self._tor_status_timer.start)
         
         layout.addStretch()
         
@@ -606,31 +933,28 @@ class SettingsDialog(QDialog):
             self.tor_directory_input.setText(directory)
 
     def update_tor_status(self):
+        self._tor_status_timer.stop()
         tor_dir = self.tor_directory_input.text().strip()
-        if not tor_dir:
-            self.tor_status_label.setText("No directory specified")
-            self.tor_status_label.setStyleSheet("color: #94a3b8; font-weight: normal;")
-            return
-        
-        if not os.path.exists(tor_dir):
-            self.tor_status_label.setText("Directory does not exist")
-            self.tor_status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
+        if tor_dir == self._tor_status_dir:
             return
-        
-        tor_executables = ["tor", "tor.exe"]
-        tor_found = False
-        for exe in tor_executables:
-            tor_path = os.path.join(tor_dir, exe)
-            if os.path.isfile(tor_path) and os.access(tor_path, os.X_OK):
-                tor_found = True
-                break
-        
-        if tor_found:
-            self.tor_status_label.setText("✓ Tor executable found")
-            self.tor_status_label.setStyleSheet("color: #22c55e; font-weight: bold;")
+        self._tor_status_dir = tor_dir
+        if not tor_dir:
+            self._set_tor_status("No directory specified", "none")
+        elif not os.path.exists(tor_dir):
+            self._set_tor_status("Directory does not exist", "error")
+        elif self.config_manager.locate_tor_executable(tor_dir, refresh=True):
+            self._set_tor_status("✓ Tor executable found", "found")
         else:
-            self.tor_status_label.setText("✗ Tor executable not found")
-            self.tor_status_label.setStyleSheet("color: #ef4444; font-weight: bold;")
+            self._set_tor_status("✗ Tor executable not found", "error")
+
+    def _set_tor_status(self, text, state):
+        """Show text in the status label, styled by the stylesheet's state rules"""
+        label = self.tor_status_label
+        label.setText(text)
+        if label.property("state") != state:
+            label.setProperty("state", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
 
     def clear_cache(self):
         reply = QMessageBox.question(self, "Clear Cache", "Are you sure you want to clear the browser cache?")
@@ -651,512 +975,194 @@ class SettingsDialog(QDialog):
     def restore_defaults(self):
         reply = QMessageBox.question(self, "Restore Defaults", "Are you sure you want to restore all settings to defaults?")
         if reply == QMessageBox.Yes:
-            
+            for index in list(self._tab_builders):
+                self._ensure_tab_built(index)
+
             self.search_engine_combo.setCurrentText("Google")
             self.homepage_input.setText("")
             self.download_directory_input.setText("")
             self.zoom_slider.setValue(100)
-            self.enable_cookies_cb.setChecked(True)
-            self.enable_javascript_cb.setChecked(True)
-            self.enable_images_cb.setChecked(True)
-            self.enable_plugins_cb.setChecked(True)
-            self.enable_popup_blocking_cb.setChecked(True)
-            self.enable_notifications_cb.setChecked(False)
-            self.clear_data_on_exit_cb.setChecked(False)
+            for attr, _, _, default in _PRIVACY_CHECKBOXES:
+                getattr(self, attr).setChecked(default)
             self.enable_spell_check_cb.setChecked(True)
             self.user_agent_input.setText("")
             self.tor_directory_input.setText("")
 
+    def refresh_from_config(self):
+        """Reset every input to the saved configuration before reopening"""
+        get = self.config_manager.get
+        self.search_engine_combo.setCurrentText(get("default_search_engine", "Google"))
+        self.homepage_input.setText(get("homepage_url", ""))
+        self.download_directory_input.setText(get("download_directory", ""))
+        self.zoom_slider.setValue(get("zoom_level", 100))
+        if self._is_built(self.create_privacy_tab):
+            for attr, _, key, default in _PRIVACY_CHECKBOXES:
+                getattr(self, attr).setChecked(get(key, default))
+            self.user_agent_input.setText(get("user_agent", ""))
+        if self._is_built(self.create_advanced_tab):
+            self.enable_spell_check_cb.setChecked(get("enable_spell_check", True))
+        if self._is_built(self.create_tor_tab):
+            self.tor_directory_input.setText(get("tor_directory", ""))
+            # Re-check on every open; Tor may have been installed since
+            self._tor_status_dir = None
+            self.update_tor_status()
+
     def get_settings(self):
-        return {
+        """Settings shown on the tabs built so far; unvisited tabs are unchanged"""
+        settings = {
             "default_search_engine": self.search_engine_combo.currentText(),
             "homepage_url": self.homepage_input.text().strip(),
             "download_directory": self.download_directory_input.text().strip(),
-            "zoom_level": self.zoom_slider.value(),
-            "enable_cookies": self.enable_cookies_cb.isChecked(),
-            "enable_javascript": self.enable_javascript_cb.isChecked(),
-            "enable_images": self.enable_images_cb.isChecked(),
-            "enable_plugins": self.enable_plugins_cb.isChecked(),
-            "enable_popup_blocking": self.enable_popup_blocking_cb.isChecked(),
-            "enable_notifications": self.enable_notifications_cb.isChecked(),
-            "clear_data_on_exit": self.clear_data_on_exit_cb.isChecked(),
-            "enable_spell_check": self.enable_spell_check_cb.isChecked(),
-            "user_agent": self.user_agent_input.text().strip(),
-            "tor_directory": self.tor_directory_input.text().strip()
+            "zoom_level": self.zoom_slider.value()
         }
+        if self._is_built(self.create_privacy_tab):
+            for attr, _, key, _ in _PRIVACY_CHECKBOXES:
+                settings[key] = getattr(self, attr).isChecked()
+            settings["user_agent"] = self.user_agent_input.text().strip()
+        if self._is_built(self.create_advanced_tab):
+            settings["enable_spell_check"] = self.enable_spell_check_cb.isChecked()
+        if self._is_built(self.create_tor_tab):
+            settings["tor_directory"] = self.tor_directory_input.text().strip()
+        return settings
 
-    def get_dialog_stylesheet(self):
-        return """
-            /* Main Dialog Styling */
-            QDialog {
-                background-color: #0f172a;
-                color: #e2e8f0;
-                font-family: 'Segoe UI', Tahoma, Arial, sans-serif;
-            }
-            
-            /* Tab Widget Styling */
-            QTabWidget::pane {
-                border: 2px solid #334155;
-                background-color: #1e293b;
-                border-radius: 8px;
-                top: -2px;
-            }
-            
-            QTabBar::tab {
-                background: linear-gradient(135deg, #334155, #475569);
-                color: #f1f5f9;
-                padding: 12px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                border: 2px solid #334155;
-                border-bottom: none;
-                font-size: 14px;
-                font-weight: 500;
-                min-width: 100px;
-            }
-            
-            QTabBar::tab:selected {
-                background: linear-gradient(135deg, #1e293b, #334155);
-                border-color: #3b82f6;
-                color: #ffffff;
-                font-weight: 600;
-            }
-            
-            QTabBar::tab:hover:!selected {
-                background: linear-gradient(135deg, #475569, #64748b);
-                border-color: #64748b;
-            }
-            
-            /* Group Box Styling */
-            QGroupBox {
-                font-weight: 600;
-                font-size: 15px;
-                border: 2px solid #334155;
-                border-radius: 12px;
-                margin-top: 15px;
-                padding-top: 15px;
-                color: #f1f5f9;
-                background-color: rgba(30, 41, 59, 0.5);
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 5px 10px;
-                background-color: #1e293b;
-                border: 1px solid #334155;
-                border-radius: 6px;
-                color: #3b82f6;
-                font-weight: bold;
-            }
-            
-            /* Label Styling */
-            QLabel {
-                color: #f1f5f9;
-                font-size: 14px;
-                font-weight: 500;
-                padding: 2px;
-            }
-            
-            /* Form Layout Labels */
-            QFormLayout QLabel {
-                color: #cbd5e1;
-                font-size: 14px;
-                font-weight: 500;
-                min-width: 150px;
-                padding-right: 10px;
-            }
-            
-            /* Input Field Styling */
-            QComboBox, QLineEdit {
-                background: linear-gradient(135deg, #1e293b, #334155);
-                border: 2px solid #475569;
-                border-radius: 8px;
-                padding: 10px 15px;
-                color: #f1f5f9;
-                font-size: 14px;
-                min-height: 20px;
-                selection-background-color: #3b82f6;
-            }
-            
-            QComboBox:focus, QLineEdit:focus {
-                border: 2px solid #3b82f6;
-                background: linear-gradient(135deg, #334155, #1e293b);
-                outline: none;
-            }
-            
-            QComboBox:hover, QLineEdit:hover {
-                border-color: #64748b;
-                background: linear-gradient(135deg, #334155, #1e293b);
-            }
-            
-            /* ComboBox Dropdown */
-            QComboBox::drop-down {
-                border: none;
-                width: 25px;
-                background: transparent;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 6px solid transparent;
-                border-right: 6px solid transparent;
-                border-top: 6px solid #94a3b8;
-                margin-right: 8px;
-            }
-            
-            QComboBox::down-arrow:hover {
-                border-top-color: #3b82f6;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #1e293b;
-                border: 2px solid #3b82f6;
-                border-radius: 8px;
-                selection-background-color: #3b82f6;
-                selection-color: white;
-                color: #f1f5f9;
-                padding: 5px;
-            }
-            
-            /* Checkbox Styling */
-            QCheckBox {
-                color: #f1f5f9;
-                font-size: 14px;
-                font-weight: 500;
-                spacing: 8px;
-            }
-            
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #475569;
-                border-radius: 4px;
-                background: linear-gradient(135deg, #1e293b, #334155);
-            }
-            
-            QCheckBox::indicator:hover {
-                border-color: #3b82f6;
-                background: linear-gradient(135deg, #334155, #1e293b);
-            }
-            
-            QCheckBox::indicator:checked {
-                background: linear-gradient(135deg, #3b82f6, #2563eb);
-                border-color: #3b82f6;
-                image: none;
-            }
-            
-            QCheckBox::indicator:checked::after {
-                content: "✓";
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            
-            /* Button Styling */
-            QPushButton {
-                background: linear-gradient(135deg, #1e293b, #334155);
-                border: 2px solid #3b82f6;
-                border-radius: 8px;
-                padding: 10px 20px;
-                color: #3b82f6;
-                font-size: 14px;
-                font-weight: 600;
-                min-height: 25px;
-            }
-            
-            QPushButton:hover {
-                background: linear-gradient(135deg, #3b82f6, #2563eb);
-                color: white;
-                border-color: #2563eb;
-                transform: translateY(-1px);
-            }
-            
-            QPushButton:pressed {
-                background: linear-gradient(135deg, #2563eb, #1d4ed8);
-                transform: translateY(0px);
-            }
-            
-            /* Slider Styling */
-            QSlider::groove:horizontal {
-                border: 2px solid #334155;
-                height: 10px;
-                background: linear-gradient(90deg, #1e293b, #334155);
-                border-radius: 6px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: linear-gradient(135deg, #3b82f6, #2563eb);
-                border: 2px solid #1e40af;
-                width: 22px;
-                height: 22px;
-                margin: -8px 0;
-                border-radius: 11px;
-            }
-            
-            QSlider::handle:horizontal:hover {
-                background: linear-gradient(135deg, #2563eb, #1d4ed8);
-                border-color: #1e40af;
-            }
-            
-            QSlider::sub-page:horizontal {
-                background: linear-gradient(90deg, #3b82f6, #2563eb);
-                border-radius: 6px;
-            }
-            
-            /* Scroll Area Styling */
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            
-            QScrollBar:vertical {
-                background-color: #1e293b;
-                width: 12px;
-                border-radius: 6px;
-                margin: 0;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #475569;
-                border-radius: 6px;
-                min-height: 20px;
-                margin: 2px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #64748b;
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            
-            /* Dialog Button Box */
-            QDialogButtonBox QPushButton {
-                min-width: 100px;
-                padding: 8px 16px;
-            }
-            
-            /* Message Box Styling */
-            QMessageBox {
-                background-color: #0f172a;
-                color: #e2e8f0;
-            }
-            
-            QMessageBox QPushButton {
-                min-width: 80px;
-                padding: 6px 12px;
-            }
-        """
 
-    def apply_web_settings(self, web_view):
-        """Apply settings to a web view"""
-        if not web_view:
-            return
-        
-        page = web_view.page()
-        settings = page.settings()
-        
-        settings.setAttribute(settings.JavascriptEnabled, 
-                            self.config_manager.get("enable_javascript", True))
-        
-        settings.setAttribute(settings.AutoLoadImages, 
-                            self.config_manager.get("enable_images", True))
-    
-        settings.setAttribute(settings.PluginsEnabled, 
-                            self.config_manager.get("enable_plugins", True))
-        
-        settings.setAttribute(settings.JavascriptCanOpenWindows, 
-                            not self.config_manager.get("enable_popup_blocking", True))
-        
-        zoom_level = self.config_manager.get("zoom_level", 100)
-        web_view.setZoomFactor(zoom_level / 100.0)
-    
-        settings.setAttribute(settings.FocusOnNavigationEnabled, True)
+class TabInfo:
+    """State of a single browser tab"""
+    __slots__ = ('widget', 'web_view', 'title')
 
-    def browse_tor_directory(self):
-        directory = QFileDialog.getExistingDirectory(
-            self, 
-            "Select Tor Installation Directory",
-            self.tor_directory_input.text()
-        )
-        if directory:
-            self.tor_directory_input.setText(directory)
+    def __init__(self, widget, title):
+        self.widget = widget
+        self.web_view = None
+        self.title = title
 
-    def update_tor_status(self):
-        tor_dir = self.tor_directory_input.text().strip()
-        if not tor_dir:
-            self.tor_status_label.setText("No directory specified")
-            self.tor_status_label.setStyleSheet("color: #94a3b8;")
-            return
-        
-        if not os.path.exists(tor_dir):
-            self.tor_status_label.setText("Directory does not exist")
-            self.tor_status_label.setStyleSheet("color: #ef4444;")
-            return
-        
-        tor_executables = ["tor", "tor.exe"]
-        tor_found = False
-        for exe in tor_executables:
-            tor_path = os.path.join(tor_dir, exe)
-            if os.path.isfile(tor_path) and os.access(tor_path, os.X_OK):
-                tor_found = True
-                break
-        
-        if tor_found:
-            self.tor_status_label.setText("Tor executable found")
-            self.tor_status_label.setStyleSheet("color: #22c55e;")
-        else:
-            self.tor_status_label.setText("Tor executable not found")
-            self.tor_status_label.setStyleSheet("color: #ef4444;")
 
-    def get_settings(self):
-        return {
-            "default_search_engine": self.search_engine_combo.currentText(),
-            "homepage_url": self.homepage_input.text().strip(),
-            "tor_directory": self.tor_directory_input.text().strip()
-        }
+class HomeWidget(QWidget):
+    """Start page shown in a tab until its first navigation"""
+
+    def __init__(self, tab_id, parent=None):
+        super().__init__(parent)
+        self.tab_id = tab_id
+        self.search_input = None
+        self.search_engine_combo = None
+        self.tor_btn = None
 
 
 class CyberBrowser(QMainWindow):
+    _LOGO_PIXMAPS = {}
+    _WEB_SETTINGS = (
+        ("JavascriptEnabled", "enable_javascript", True),
+        ("AutoLoadImages", "enable_images", True),
+        ("PluginsEnabled", "enable_plugins", True),
+    )
+    _APP_ICON = None
+
+    @classmethod
+    def _app_icon(cls):
+        """Build the window icon once and share it between windows"""
+        if cls._APP_ICON is None:
+            cls._APP_ICON = QIcon(ASSET_LOGO) if _LOGO_EXISTS else QIcon()
+        return cls._APP_ICON
+
+    @classmethod
+    def _get_logo(cls, ratio):
+        """Load and scale the home page logo once per device pixel ratio"""
+        pixmap = cls._LOGO_PIXMAPS.get(ratio)
+        if pixmap is None:
+            pixmap = QPixmap(ASSET_LOGO) if _LOGO_EXISTS else QPixmap()
+            if not pixmap.isNull():
+                size = int(120 * ratio)
+                pixmap = pixmap.scaled(size, size, _KEEP_AR, _SMOOTH)
+                pixmap.setDevicePixelRatio(ratio)
+            cls._LOGO_PIXMAPS[ratio] = pixmap
+        return pixmap
+
     def __init__(self):
         super().__init__()
         self.config_manager = ConfigManager()
-        self.tor_manager = TorManager(self.config_manager)
-        self.tor_manager.tor_status_changed.connect(self.on_tor_status_changed)
+        self._tor_manager = None
+        self._pending_search_tab = None
         
         self.setWindowTitle("CyberBrowser - Tor Ready")
-        window_width = self.config_manager.get("window_width", 1400)
-        window_height = self.config_manager.get("window_height", 900)
-        
-        self.resize(window_width, window_height)
+        geometry = self.config_manager.get("window_geometry", "")
+        if not geometry or not self.restoreGeometry(QByteArray.fromHex(geometry.encode('ascii'))):
+            self.resize(self.config_manager.get("window_width", 1400),
+                        self.config_manager.get("window_height", 900))
         
-        try:
-            self.setWindowIcon(QIcon("assets/CyberBrowser.png"))
-        except:
-            pass
+        if _LOGO_EXISTS:
+            self.setWindowIcon(self._app_icon())
 
-        self.stack = QStackedLayout()
+        self.stack = QStackedWidget()
         self.tab_data = {}  
         self.next_tab_id = 0
-        self.tab_id_mapping = {} 
-        
-        self.normal_profile = QWebEngineProfile.defaultProfile()
-        self.tor_profile = None
-
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #0f172a;
-                color: #e2e8f0;
-                font-family: 'Segoe UI', Tahoma, Arial, sans-serif;
-            }
-            QLabel#title {
-                color: #f8fafc;
-                font-size: 48px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-            QLabel#subtitle {
-                color: #94a3b8;
-                font-size: 18px;
-                margin-bottom: 25px;
-            }
-            QLineEdit {
-                background-color: #1e293b;
-                border: 2px solid #334155;
-                border-radius: 24px;
-                padding: 12px 20px;
-                font-size: 16px;
-                color: #f1f5f9;
-                min-width: 450px;
-                max-width: 550px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #3b82f6;
-            }
-            QPushButton {
-                background-color: transparent;
-                border: 2px solid #3b82f6;
-                border-radius: 20px;
-                padding: 8px 20px;
-                font-size: 15px;
-                color: #3b82f6;
-                min-width: 100px;
-                max-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #3b82f6;
-                color: white;
-            }
-            QPushButton#settings_btn {
-                border-radius: 15px;
-                min-width: 80px;
-                max-width: 100px;
-                padding: 6px 15px;
-                font-size: 13px;
-            }
-            QPushButton#tor_unavailable {
-                border-color: #ef4444;
-                color: #ef4444;
-            }
-            QPushButton#tor_unavailable:hover {
-                background-color: #ef4444;
-                color: white;
-            }
-            QPushButton#tor_enabled {
-                border-color: #22c55e;
-                color: #22c55e;
-            }
-            QPushButton#tor_enabled:hover {
-                background-color: #22c55e;
-                color: white;
-            }
-            QComboBox {
-                background-color: #1e293b;
-                border: 2px solid #334155;
-                border-radius: 15px;
-                padding: 6px 15px;
-                font-size: 14px;
-                color: #f1f5f9;
-                min-width: 120px;
-                max-width: 150px;
-            }
-            QComboBox:focus {
-                border: 2px solid #3b82f6;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #94a3b8;
-                margin-right: 5px;
-            }
-            QTabBar::tab {
-                background: #1e293b;
-                border: 1px solid #334155;
-                border-bottom: none;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                padding: 8px 20px;
-                margin-right: -1px;
-                color: #f1f5f9;
-                min-width: 80px;
-                max-width: 150px;
-            }
-            QTabBar::tab:selected {
-                background: #334155;
-                color: white;
-            }
-        """)
+        self._title_cache = {}
+        self._tab_index_by_id = {}
+        self._tor_running = False
+        
+        self._normal_profile = None
+        self._tor_profile = None
+        self._webview_pool = []
+        self._settings_dialog = None
+        self._engine_names = list(self.config_manager.search_engines)
+
+        # Coalesces bursts of Tor status signals into one button refresh
+        self._tor_buttons_timer = QTimer(self)
+        self._tor_buttons_timer.setSingleShot(True)
+        self._tor_buttons_timer.setInterval(0)
+        self._tor_buttons_timer.timeout.connect(self.refresh_tor_buttons)
 
         self.init_ui()
 
+        QTimer.singleShot(200, self._warm_webengine)
+
+    @property
+    def tor_manager(self):
+        """Tor process manager, created the first time Tor is started"""
+        if self._tor_manager is None:
+            self._tor_manager = TorManager(self.config_manager)
+            self._tor_manager.tor_status_changed.connect(self.on_tor_status_changed)
+            self._tor_manager.tor_start_failed.connect(self.on_tor_start_failed)
+        return self._tor_manager
+
+    def is_tor_running(self):
+        """Last Tor state reported by tor_status_changed"""
+        return self._tor_running
+
+    @property
+    def normal_profile(self):
+        """Shared profile for non-Tor pages, created on first navigation"""
+        if self._normal_profile is None:
+            webengine = load_webengine()
+            profile_dir = os.path.join(os.path.expanduser("~"), ".cyberbrowser")
+            profile = webengine.QWebEngineProfile("CyberBrowser", self)
+            profile.setCachePath(os.path.join(profile_dir, "cache"))
+            profile.setPersistentStoragePath(os.path.join(profile_dir, "storage"))
+            profile.setHttpCacheType(webengine.QWebEngineProfile.DiskHttpCache)
+            profile.setHttpCacheMaximumSize(200 * 1024 * 1024)
+            if self.config_manager.get("enable_cookies", True):
+                profile.setPersistentCookiesPolicy(webengine.QWebEngineProfile.AllowPersistentCookies)
+            else:
+                profile.setPersistentCookiesPolicy(webengine.QWebEngineProfile.NoPersistentCookies)
+            self._normal_profile = profile
+        return self._normal_profile
+
+    @property
+    def tor_profile(self):
+        """Profile shared by every Tor tab, with its downloads routed here once"""
+        if self._tor_profile is None:
+            self._tor_profile = load_webengine().get_tor_profile(self.config_manager, self)
+            self._tor_profile.downloadRequested.connect(self.handle_download)
+        return self._tor_profile
+
+    def _warm_webengine(self):
+        """Keep a started web view in the pool so the next search skips building one"""
+        if self._webview_pool:
+            return
+        webengine = load_webengine()
+        view = webengine.LazyWebView()
+        view.setPage(webengine.QWebEnginePage(self.normal_profile, view))
+        view.load(QUrl("about:blank"))
+        self._webview_pool.append(view)
+
     def init_ui(self):
         main_widget = QWidget()
         main_layout = QVBoxLayout(main_widget)
@@ -1170,8 +1176,10 @@ class CyberBrowser(QMainWindow):
         self.tab_bar.setMovable(True)
         self.tab_bar.addTab("Home")
         self.tab_bar.addTab("+")
+        self.tab_bar.setTabsClosable(True)
+        self.tab_bar.setTabButton(1, QTabBar.RightSide, None)
         self.tab_bar.currentChanged.connect(self.on_tab_changed)
-        self.tab_bar.tabMoved.connect(self.on_tab_moved)
+        self.tab_bar.tabCloseRequested.connect(self.close_tab)
 
         top_bar.addWidget(self.tab_bar)
         top_bar.addStretch()
@@ -1182,7 +1190,7 @@ class CyberBrowser(QMainWindow):
         top_bar.addWidget(settings_btn)
 
         main_layout.addLayout(top_bar)
-        main_layout.addLayout(self.stack)
+        main_layout.addWidget(self.stack)
 
         self.create_home_tab()
 
@@ -1190,63 +1198,109 @@ class CyberBrowser(QMainWindow):
 
     def on_tor_status_changed(self, is_running, status_message):
         """Handle Tor status changes"""
-        print(f"Tor status: {status_message}")
-
-        for tab_id, tab_info in self.tab_data.items():
-            widget = tab_info['widget']
-            if hasattr(widget, 'tor_btn'):
-                self.update_tor_button(widget.tor_btn)
+        logger.info("Tor status: %s", status_message)
+        self._tor_running = is_running
+        self._tor_buttons_timer.start()
+
+        if is_running and self._pending_search_tab is not None:
+            tab_id, self._pending_search_tab = self._pending_search_tab, None
+            self.perform_search(tab_id)
+
+    def on_tor_start_failed(self, message):
+        """Turn Tor mode back off when the background startup gives up"""
+        self._pending_search_tab = None
+        self.config_manager.set("enable_tor", False)
+        self.remove_tor_proxy()
+        self.refresh_tor_buttons()
+        QMessageBox.warning(self, "Tor Error", f"{message}. Please check your Tor configuration.")
 
     def open_settings(self):
-        dialog = SettingsDialog(self.config_manager, self)
+        dialog = self._settings_dialog
+        if dialog is None:
+            dialog = self._settings_dialog = SettingsDialog(self.config_manager, self)
+        else:
+            dialog.refresh_from_config()
         if dialog.exec_() == QDialog.Accepted:
             settings = dialog.get_settings()
-            for key, value in settings.items():
-                self.config_manager.set(key, value)
-            
-            self.update_home_tabs()
+            changed = {key: value for key, value in settings.items()
+                       if self.config_manager.get(key) != value}
+            if not changed:
+                return
+
+            self.config_manager.update(changed)
+            self.config_manager.flush()
+
+            if "default_search_engine" in changed or "search_engines" in changed:
+                self.update_home_tabs()
+            elif "enable_tor" in changed or "tor_directory" in changed:
+                self.refresh_tor_buttons()
 
     def update_home_tabs(self):
         """Update search engine dropdowns and Tor buttons in existing home tabs"""
-        for tab_id, tab_info in self.tab_data.items():
-            widget = tab_info['widget']
-            if hasattr(widget, 'search_engine_combo') and hasattr(widget, 'tab_id'):
-
-                current_text = widget.search_engine_combo.currentText()
-                widget.search_engine_combo.clear()
-                search_engines = self.config_manager.get("search_engines", {})
-                widget.search_engine_combo.addItems(search_engines.keys())
-                
-                default_engine = self.config_manager.get("default_search_engine", "Google")
-                if default_engine in search_engines:
-                    widget.search_engine_combo.setCurrentText(default_engine)
-                elif current_text in search_engines:
-                    widget.search_engine_combo.setCurrentText(current_text)
-                
-                if hasattr(widget, 'tor_btn'):
+        search_engines = self.config_manager.search_engines
+        engine_names = list(search_engines)
+        default_engine = self.config_manager.get("default_search_engine", "Google")
+        rebuild = engine_names != self._engine_names
+        self._engine_names = engine_names
+
+        with updates_suspended(self):
+            for tab_id, tab_info in self.tab_data.items():
+                widget = tab_info.widget
+                if isinstance(widget, HomeWidget):
+                    combo = widget.search_engine_combo
+                    current_text = combo.currentText()
+                    if default_engine in search_engines:
+                        target = default_engine
+                    elif current_text in search_engines:
+                        target = current_text
+                    else:
+                        target = None
+
+                    combo.blockSignals(True)
+                    try:
+                        if rebuild:
+                            combo.clear()
+                            combo.addItems(engine_names)
+                        if target is not None and combo.currentText() != target:
+                            combo.setCurrentText(target)
+                    finally:
+                        combo.blockSignals(False)
+
+                    self.update_tor_button(widget.tor_btn)
+
+    def refresh_tor_buttons(self):
+        """Update the Tor button on every home tab"""
+        with updates_suspended(self):
+            for tab_id, tab_info in self.tab_data.items():
+                widget = tab_info.widget
+                if isinstance(widget, HomeWidget):
                     self.update_tor_button(widget.tor_btn)
 
     def update_tor_button(self, tor_btn):
         """Update Tor button text and style based on current status"""
         tor_enabled = self.config_manager.get("enable_tor", False)
         tor_available = self.config_manager.is_tor_available()
-        tor_running = self.tor_manager.is_tor_running()
+        tor_running = self.is_tor_running()
         
         if not tor_available:
-            tor_btn.setText("Tor: Unavailable")
-            tor_btn.setObjectName("tor_unavailable")
+            text, name = "Tor: Unavailable", "tor_unavailable"
         elif tor_enabled and tor_running:
-            tor_btn.setText("Tor: Connected")
-            tor_btn.setObjectName("tor_enabled")
-        elif tor_enabled and not tor_running:
-            tor_btn.setText("Tor: Connecting...")
-            tor_btn.setObjectName("tor_unavailable")
+            text, name = "Tor: Connected", "tor_enabled"
+        elif tor_enabled and self._tor_manager is not None and self._tor_manager.is_starting:
+            progress = self._tor_manager.bootstrap_progress
+            text = f"Tor: Connecting... {progress}%" if progress else "Tor: Connecting..."
+            name = "tor_unavailable"
+        elif tor_enabled:
+            text, name = "Tor: Stopped", "tor_unavailable"
         else:
-            tor_btn.setText("Tor: Disabled")
-            tor_btn.setObjectName("")
-        
-        tor_btn.style().unpolish(tor_btn)
-        tor_btn.style().polish(tor_btn)
+            text, name = "Tor: Disabled", ""
+
+        if tor_btn.text() != text:
+            tor_btn.setText(text)
+        if tor_btn.objectName() != name:
+            tor_btn.setObjectName(name)
+            tor_btn.style().unpolish(tor_btn)
+            tor_btn.style().polish(tor_btn)
 
     def create_home_tab(self):
         tab_id = self.next_tab_id
@@ -1255,83 +1309,68 @@ class CyberBrowser(QMainWindow):
         home_widget = self.create_home_widget(tab_id)
         self.stack.addWidget(home_widget)
         
-        self.tab_data[tab_id] = {
-            'widget': home_widget,
-            'web_view': None,
-            'title': 'Home'
-        }
+        self.tab_data[tab_id] = TabInfo(home_widget, 'Home')
         
-        self.tab_id_mapping[0] = tab_id
+        self.tab_bar.setTabData(0, tab_id)
         
         return tab_id
 
     def create_home_widget(self, tab_id):
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setAlignment(Qt.AlignCenter)
+        widget = HomeWidget(tab_id)
+        layout = QGridLayout(widget)
         layout.setSpacing(15)
 
         logo_label = QLabel()
-        try:
-            logo_pixmap = QPixmap("assets/CyberBrowser.png").scaled(120, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        logo_pixmap = self._get_logo(self.devicePixelRatioF())
+        if not logo_pixmap.isNull():
             logo_label.setPixmap(logo_pixmap)
-        except:
+        else:
             logo_label.setText("🌐")
-            logo_label.setStyleSheet("font-size: 72px;")
-        logo_label.setAlignment(Qt.AlignCenter)
+            logo_label.setObjectName("logo_fallback")
+        logo_label.setAlignment(_ALIGN_CENTER)
 
-        title = QLabel("CyberBrowser")
-        title.setObjectName("title")
-        title.setAlignment(Qt.AlignCenter)
+        title = plain_label("CyberBrowser", "title")
+        title.setAlignment(_ALIGN_CENTER)
 
-        subtitle = QLabel("Fast. Anonymous. Tor-Ready.")
-        subtitle.setObjectName("subtitle")
-        subtitle.setAlignment(Qt.AlignCenter)        
+        subtitle = plain_label("Fast. Anonymous. Tor-Ready.", "subtitle")
+        subtitle.setAlignment(_ALIGN_CENTER)
 
-        search_engine_layout = QHBoxLayout()
-        search_engine_layout.setAlignment(Qt.AlignCenter)
-        
-        engine_label = QLabel("Search with:")
-        engine_label.setStyleSheet("color: #94a3b8; font-size: 14px; margin-right: 10px;")
+        engine_label = plain_label("Search with:", "engine_label")
         
         search_engine_combo = QComboBox()
-        search_engines = self.config_manager.get("search_engines", {})
-        search_engine_combo.addItems(search_engines.keys())
+        search_engine_combo.addItems(self._engine_names)
         default_engine = self.config_manager.get("default_search_engine", "Google")
-        if default_engine in search_engines:
+        if default_engine in self.config_manager.search_engines:
             search_engine_combo.setCurrentText(default_engine)
-        
-        search_engine_layout.addWidget(engine_label)
-        search_engine_layout.addWidget(search_engine_combo)
 
         search_input = QLineEdit()
         search_input.setPlaceholderText("Search or enter a website (.onion sites work with Tor)")
-        search_input.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        search_input.returnPressed.connect(lambda: self.perform_search(tab_id))
+        search_input.setSizePolicy(_SP_FIXED, _SP_FIXED)
+        search_input.returnPressed.connect(partial(self.perform_search, tab_id))
 
-        buttons_layout = QHBoxLayout()
-        buttons_layout.setAlignment(Qt.AlignCenter)
         start_btn = QPushButton("Start")
-        start_btn.clicked.connect(lambda: self.perform_search(tab_id))
+        start_btn.clicked.connect(partial(self.perform_search, tab_id))
         
         tor_btn = QPushButton()
         self.update_tor_button(tor_btn)
         tor_btn.clicked.connect(self.toggle_tor)
-        
-        buttons_layout.addWidget(start_btn)
-        buttons_layout.addWidget(tor_btn)
 
-        layout.addWidget(logo_label)
-        layout.addWidget(title)
-        layout.addWidget(subtitle)
-        layout.addLayout(search_engine_layout)
-        layout.addWidget(search_input)
-        layout.addLayout(buttons_layout)
+        layout.setRowStretch(0, 1)
+        layout.setColumnStretch(0, 1)
+        layout.setColumnStretch(1, 1)
+        layout.addWidget(logo_label, 1, 0, 1, 2, _ALIGN_CENTER)
+        layout.addWidget(title, 2, 0, 1, 2, _ALIGN_CENTER)
+        layout.addWidget(subtitle, 3, 0, 1, 2, _ALIGN_CENTER)
+        layout.addWidget(engine_label, 4, 0, _ALIGN_RIGHT)
+        layout.addWidget(search_engine_combo, 4, 1, _ALIGN_LEFT)
+        layout.addWidget(search_input, 5, 0, 1, 2, _ALIGN_CENTER)
+        layout.addWidget(start_btn, 6, 0, _ALIGN_RIGHT)
+        layout.addWidget(tor_btn, 6, 1, _ALIGN_LEFT)
+        layout.setRowStretch(7, 1)
 
         widget.search_input = search_input
         widget.search_engine_combo = search_engine_combo
         widget.tor_btn = tor_btn
-        widget.tab_id = tab_id
         
         return widget
 
@@ -1353,138 +1392,139 @@ class CyberBrowser(QMainWindow):
 
             success = self.tor_manager.start_tor()
             if success:
-
-                QApplication.processEvents()
                 self.setup_tor_proxy()
             else:
                 self.config_manager.set("enable_tor", False)
         else:
 
+            self._pending_search_tab = None
             self.tor_manager.stop_tor()
             self.remove_tor_proxy()
         
-        for tab_id, tab_info in self.tab_data.items():
-            widget = tab_info['widget']
-            if hasattr(widget, 'tor_btn'):
-                self.update_tor_button(widget.tor_btn)
+        self.refresh_tor_buttons()
 
     def setup_tor_proxy(self):
         """Configure the application to use Tor SOCKS proxy"""
-
-        os.environ['QTWEBENGINE_CHROMIUM_FLAGS'] = (
-            '--proxy-server=socks5://127.0.0.1:9050 '
-            '--host-resolver-rules="MAP * ~NOTFOUND , EXCLUDE 127.0.0.1" '
-            '--disable-extensions '
-            '--disable-plugins '
-            '--disable-web-security '
-            '--allow-running-insecure-content'
+        # QtWebEngine ignores custom proxy factories but follows the
+        # application proxy, including changes made after start-up. The
+        # proxy is application wide, so the normal profile uses Tor too.
+        # Chromium resolves host names through a SOCKS5 proxy itself.
+        QNetworkProxy.setApplicationProxy(
+            QNetworkProxy(QNetworkProxy.Socks5Proxy, "127.0.0.1", self.tor_manager.tor_port)
         )
-        
-        if self.tor_profile is None:
-            self.tor_profile = TorWebEngineProfile(tor_enabled=True, parent=self)
-        
-        print("Tor proxy configured - .onion sites should now be accessible")
+        self.tor_profile
+
+        logger.info("Tor proxy configured - .onion sites should now be accessible")
 
     def remove_tor_proxy(self):
         """Remove Tor proxy configuration"""
-
-        if 'QTWEBENGINE_CHROMIUM_FLAGS' in os.environ:
-            del os.environ['QTWEBENGINE_CHROMIUM_FLAGS']
-        
         QNetworkProxyFactory.setUseSystemConfiguration(True)
-        
-        print("Tor proxy removed - using normal connection")
+
+        logger.info("Tor proxy removed - using normal connection")
 
     def create_new_tab(self):
         new_tab_index = self.tab_bar.count() - 1
         tab_id = self.next_tab_id
         self.next_tab_id += 1
         
-        self.tab_bar.insertTab(new_tab_index, f"New Tab")
-        
-        new_mapping = {}
-        for tab_index, existing_tab_id in self.tab_id_mapping.items():
-            if tab_index >= new_tab_index:
-                new_mapping[tab_index + 1] = existing_tab_id
-            else:
-                new_mapping[tab_index] = existing_tab_id
-        new_mapping[new_tab_index] = tab_id
-        self.tab_id_mapping = new_mapping
+        with self._batched_tab_updates():
+            self.tab_bar.insertTab(new_tab_index, f"New Tab")
+            self.tab_bar.setTabData(new_tab_index, tab_id)
         
         home_widget = self.create_home_widget(tab_id)
         self.stack.addWidget(home_widget)
         
-        self.tab_data[tab_id] = {
-            'widget': home_widget,
-            'web_view': None,
-            'title': 'New Tab'
-        }
+        self.tab_data[tab_id] = TabInfo(home_widget, 'New Tab')
         
         self.tab_bar.setCurrentIndex(new_tab_index)
 
-    def on_tab_moved(self, from_index, to_index):
-        moved_tab_id = self.tab_id_mapping[from_index]
-        
-        del self.tab_id_mapping[from_index]
-        
-        new_mapping = {}
-        for tab_index, tab_id in sorted(self.tab_id_mapping.items()):
-            if from_index < to_index:  
-                if tab_index <= to_index:
-                    new_mapping[tab_index - 1] = tab_id
-                else:
-                    new_mapping[tab_index] = tab_id
-            else:
-                if tab_index >= to_index:
-                    new_mapping[tab_index + 1] = tab_id
-                else:
-                    new_mapping[tab_index] = tab_id
-        
-        new_mapping[to_index] = moved_tab_id
-        self.tab_id_mapping = new_mapping
-
     def on_tab_changed(self, index):
-        if index >= 0 and index < self.tab_bar.count():
-            tab_text = self.tab_bar.tabText(index)
-            if tab_text == "+":
-                self.create_new_tab()
-                return
-            
-            if index in self.tab_id_mapping:
-                tab_id = self.tab_id_mapping[index]
-                if tab_id in self.tab_data:
-                    widget = self.tab_data[tab_id]['widget']
-                    self.stack.setCurrentWidget(widget)
+        if index < 0:
+            return
+        tab_id = self.tab_bar.tabData(index)
+        if tab_id is None:
+            # Only the "+" tab carries no tab id
+            self.create_new_tab()
+            return
+
+        tab_info = self.tab_data.get(tab_id)
+        if tab_info is not None:
+            self.stack.setCurrentWidget(tab_info.widget)
+
+    def close_tab(self, index):
+        tab_id = self.tab_bar.tabData(index)
+        if tab_id not in self.tab_data or len(self.tab_data) == 1:
+            return
+
+        if index == self.tab_bar.currentIndex():
+            self.tab_bar.setCurrentIndex(index - 1 if index > 0 else index + 1)
+        with self._batched_tab_updates():
+            self.tab_bar.removeTab(index)
+
+        tab_info = self.tab_data.pop(tab_id)
+        self._title_cache.pop(tab_id, None)
+        self._tab_index_by_id.pop(tab_id, None)
+        self.stack.removeWidget(tab_info.widget)
+        if tab_info.web_view is not None:
+            self._release_webview(tab_info.web_view)
+        else:
+            tab_info.widget.deleteLater()
+
+    def _take_webview(self, profile):
+        """Reuse a pooled web view for profile, or create a new one"""
+        webengine = load_webengine()
+        if self._webview_pool:
+            browser = self._webview_pool.pop()
+        else:
+            browser = webengine.LazyWebView()
+        if not self._webview_pool:
+            QTimer.singleShot(_WEBVIEW_REFILL_DELAY, self._warm_webengine)
+        if browser.page().profile() is not profile:
+            browser.setPage(webengine.QWebEnginePage(profile, browser))
+        return browser
+
+    def _release_webview(self, browser):
+        """Blank a closed tab's web view and keep it for the next tab"""
+        try:
+            browser.loadFinished.disconnect()
+        except TypeError:
+            pass
+        if len(self._webview_pool) >= _WEBVIEW_POOL_SIZE:
+            browser.deleteLater()
+            return
+        browser.blank()
+        self._webview_pool.append(browser)
 
     def get_web_engine_profile(self):
         """Get the appropriate web engine profile based on Tor status"""
         tor_enabled = self.config_manager.get("enable_tor", False)
-        tor_running = self.tor_manager.is_tor_running()
+        tor_running = self.is_tor_running()
         
         if tor_enabled and tor_running:
-            if self.tor_profile is None:
-                self.tor_profile = TorWebEngineProfile(tor_enabled=True, parent=self)
             return self.tor_profile
         else:
             return self.normal_profile
 
-    def create_tor_browser_view(self, url):
+    def apply_web_settings(self, web_view):
+        """Apply the privacy and display settings to a web view"""
+        if not web_view:
+            return
+
+        settings = web_view.page().settings()
+        get = self.config_manager.get
+        for attr, key, default in self._WEB_SETTINGS:
+            settings.setAttribute(getattr(settings, attr), get(key, default))
+        settings.setAttribute(settings.JavascriptCanOpenWindows,
+                              not get("enable_popup_blocking", True))
+        settings.setAttribute(settings.FocusOnNavigationEnabled, True)
+
+        web_view.setZoomFactor(get("zoom_level", 100) / 100.0)
+
+    def create_tor_browser_view(self):
         """Create a QWebEngineView specifically configured for Tor"""
-        browser = QWebEngineView()
-        
-        
-        profile = self.get_web_engine_profile()
-        page = QWebEnginePage(profile, browser)
-        browser.setPage(page)
-        
-        page.profile().downloadRequested.connect(self.handle_download)
+        browser = self._take_webview(self.tor_profile)
         browser.setContextMenuPolicy(Qt.DefaultContextMenu)
-        
-        if url and '.onion' in url:
-            page.profile().setHttpUserAgent("Mozilla/5.0 (Windows NT 10.0; rv:91.0) Gecko/20100101 Firefox/91.0")
-        
         self.apply_web_settings(browser)
-        browser.page().profile().downloadRequested.connect(self.handle_download)
     
         return browser
     
@@ -1512,9 +1552,9 @@ class CyberBrowser(QMainWindow):
             return
             
         tab_info = self.tab_data[tab_id]
-        widget = tab_info['widget']
+        widget = tab_info.widget
         
-        if not hasattr(widget, 'search_input'):
+        if not isinstance(widget, HomeWidget):
             return
             
         query = widget.search_input.text().strip()
@@ -1522,7 +1562,7 @@ class CyberBrowser(QMainWindow):
             return
 
         tor_enabled = self.config_manager.get("enable_tor", False)
-        tor_running = self.tor_manager.is_tor_running()
+        tor_running = self.is_tor_running()
         
         if tor_enabled and not tor_running:
             QMessageBox.warning(
@@ -1532,7 +1572,7 @@ class CyberBrowser(QMainWindow):
             )
             return
 
-        if '.onion' in query and not (tor_enabled and tor_running):
+        if _ONION_RE.search(query) and not (tor_enabled and tor_running):
             reply = QMessageBox.question(
                 self,
                 "Onion Site Detected",
@@ -1546,11 +1586,11 @@ class CyberBrowser(QMainWindow):
                     success = self.tor_manager.start_tor()
                     if success:
                         self.setup_tor_proxy()
-
-                        for tid, tinfo in self.tab_data.items():
-                            tw = tinfo['widget']
-                            if hasattr(tw, 'tor_btn'):
-                                self.update_tor_button(tw.tor_btn)
+                        self.refresh_tor_buttons()
+                        if not self.is_tor_running():
+                            self._pending_search_tab = tab_id
+                            return
+                        tor_enabled = tor_running = True
                     else:
                         QMessageBox.warning(self, "Tor Error", "Failed to start Tor. Please check your Tor configuration.")
                         return
@@ -1560,108 +1600,118 @@ class CyberBrowser(QMainWindow):
             else:
                 return
 
-        selected_engine = "Google"  
-        if hasattr(widget, 'search_engine_combo'):
-            selected_engine = widget.search_engine_combo.currentText()
+        selected_engine = widget.search_engine_combo.currentText()
 
-        if "." in query and " " not in query and not query.startswith("http"):
-            url = "http://" + query
-            search_title = query.split('.')[0].capitalize()
-        elif query.startswith("http"):
-            url = query
-            search_title = query.split('/')[2] if '/' in query else query
+        match = _URL_RE.match(query)
+        if match:
+            qurl = QUrl.fromUserInput(query)
+            host = match.group('host')
+            search_title = host if host is not None else match.group('bare').capitalize()
         else:
-            url = self.config_manager.get_search_url(selected_engine, query)
+            qurl = QUrl(self.config_manager.get_search_url(selected_engine, query))
             search_title = f"{selected_engine}: {query[:20]}..."
+        url = qurl.toString()
 
-        if tab_info['web_view'] is None:
-
-            if tor_enabled and tor_running:
-                browser = self.create_tor_browser_view(url)
-                print(f"Created Tor browser for: {url}")
+        # Only home tabs reach here; a tab keeps its web view once it has one
+        if tor_enabled and tor_running:
+            browser = self.create_tor_browser_view()
+            logger.debug("Created Tor browser for: %s", url)
+        else:
+            browser = self._take_webview(self.normal_profile)
+        
+        def on_load_finished(success):
+            if success:
+                logger.debug("Successfully loaded: %s", url)
             else:
-                browser = QWebEngineView()
-                page = QWebEnginePage(self.normal_profile, browser)
-                browser.setPage(page)
-            
-            browser.load(QUrl(url))
-            
-            def on_load_finished(success):
-                if success:
-                    print(f"Successfully loaded: {url}")
-                else:
-                    print(f"Failed to load: {url}")
-                    if '.onion' in url:
-                        print("Note: .onion sites require Tor to be running")
-            
-            browser.loadFinished.connect(on_load_finished)
-            
-            old_widget = tab_info['widget']
-            self.stack.removeWidget(old_widget)
-            old_widget.deleteLater()
-            
+                logger.warning("Failed to load: %s", url)
+                if _ONION_RE.search(url):
+                    logger.info("Note: .onion sites require Tor to be running")
+        
+        browser.loadFinished.connect(on_load_finished)
+        
+        self._attach_webview(browser, tab_info.widget)
+        browser.defer_load(qurl)
+        
+        tab_info.widget = browser
+        tab_info.web_view = browser
+        tab_info.title = search_title
+        
+        self.update_tab_title(tab_id, search_title)
+
+    def _attach_webview(self, browser, old_widget):
+        """Swap a tab's widget for its web view directly in the stacked widget
+
+        Web views must stay plain children of the stack: embedding them in a
+        QGraphicsView through a proxy widget breaks GPU compositing.
+        """
+        if browser.graphicsProxyWidget() is not None:
+            raise ValueError("Web views cannot be embedded through QGraphicsProxyWidget")
+
+        browser.page().setBackgroundColor(_PAGE_BACKGROUND)
+
+        with updates_suspended(self.stack):
             self.stack.addWidget(browser)
             self.stack.setCurrentWidget(browser)
-            
-            tab_info['widget'] = browser
-            tab_info['web_view'] = browser
-            tab_info['title'] = search_title
-            
-            self.update_tab_title(tab_id, search_title)
-        else:
-            browser = tab_info['web_view']
-            
-            current_profile = browser.page().profile()
-            new_profile = self.get_web_engine_profile()
-            
-            if current_profile != new_profile:
+            self.stack.removeWidget(old_widget)
+        old_widget.hide()
+        old_widget.deleteLater()
 
-                new_page = QWebEnginePage(new_profile, browser)
-                browser.setPage(new_page)
-            
-            browser.load(QUrl(url))
-            self.stack.setCurrentWidget(browser)
-            
-            tab_info['title'] = search_title
-            self.update_tab_title(tab_id, search_title)
+    def _batched_tab_updates(self):
+        """Suppress tab bar repaints while several tabs are mutated"""
+        return updates_suspended(self.tab_bar)
 
     def update_tab_title(self, tab_id, title):
-        for tab_index, mapped_tab_id in self.tab_id_mapping.items():
-            if mapped_tab_id == tab_id:
-                display_title = title[:12] + "..." if len(title) > 15 else title
-                self.tab_bar.setTabText(tab_index, display_title)
-                break
+        display_title = title[:12] + "..." if len(title) > 15 else title
+        if self._title_cache.get(tab_id) == display_title:
+            return
 
-    def test_tor_connection(self):
-        """Test if Tor is working by checking the SOCKS proxy"""
-        try:
-            import socks
-            import socket
-            
-            sock = socks.socksocket()
-            sock.set_proxy(socks.SOCKS5, "127.0.0.1", 9050)
-            sock.settimeout(10)
-            
-            sock.connect(("duckduckgogg42ts72.onion", 80))
-            sock.close()
-            return True
-        except Exception as e:
-            print(f"Tor connection test failed: {e}")
-            return False
+        tab_index = self.tab_index(tab_id)
+        if tab_index < 0:
+            return
+        if self.tab_bar.tabText(tab_index) != display_title:
+            self.tab_bar.setTabText(tab_index, display_title)
+        self._title_cache[tab_id] = display_title
+
+    def tab_index(self, tab_id):
+        """Return the tab bar index of tab_id, or -1 if it has no tab"""
+        tab_index = self._tab_index_by_id.get(tab_id, -1)
+        if tab_index >= 0 and self.tab_bar.tabData(tab_index) == tab_id:
+            return tab_index
+
+        for tab_index in range(self.tab_bar.count()):
+            if self.tab_bar.tabData(tab_index) == tab_id:
+                self._tab_index_by_id[tab_id] = tab_index
+                return tab_index
+        return -1
+
+    def test_tor_connection(self, callback):
+        """Test if Tor is working through the SOCKS proxy; callback gets the result"""
+        signals = TorConnectionTestSignals(self)
+        signals.finished.connect(callback)
+        signals.finished.connect(signals.deleteLater)
+        QThreadPool.globalInstance().start(TorConnectionTest(self.tor_manager.tor_port, signals))
 
     def closeEvent(self, event):
+        self.config_manager.set("window_geometry", bytes(self.saveGeometry().toHex()).decode('ascii'))
 
-        self.tor_manager.stop_tor()
-        
-        self.config_manager.set("window_width", self.width())
-        self.config_manager.set("window_height", self.height())
+        # Hide first so waiting for Tor to exit does not show a frozen window
+        self.hide()
+        if self._tor_manager is not None:
+            self._tor_manager.stop_tor()
+            self._tor_manager.wait_for_stop()
+
+        self.config_manager.flush()
         super().closeEvent(event)
 
 
 if __name__ == "__main__":
-    os.environ['QT_LOGGING_RULES'] = 'qt.qpa.fonts.debug=false;js.debug=false'
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     app = QApplication(sys.argv)
     app.setAttribute(Qt.AA_DisableWindowContextHelpButton, True)
+    app.setStyleSheet(load_stylesheet())
     
     window = CyberBrowser()
     window.show()
@@ -0,0 +1,100 @@
+import os
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEngineProfile, QWebEnginePage
+from PyQt5.QtCore import QTimer, QUrl
+
+_tor_profile = None
+
+
+class TorWebEngineProfile(QWebEngineProfile):
+    """Custom web engine profile that uses Tor proxy"""
+    
+    def __init__(self, tor_enabled=False, config_manager=None, parent=None):
+        super().__init__(parent)
+        self.tor_enabled = tor_enabled
+        self.config_manager = config_manager
+        self.setup_profile()
+        
+    def setup_profile(self):
+        if self.tor_enabled:
+            self.setHttpUserAgent("Mozilla/5.0 (Windows NT 10.0; rv:91.0) Gecko/20100101 Firefox/91.0")
+            
+            self.setPersistentCookiesPolicy(QWebEngineProfile.NoPersistentCookies)
+            self.setHttpCacheType(QWebEngineProfile.MemoryHttpCache)
+            self.setHttpCacheMaximumSize(0)
+        else:
+
+            self.setHttpUserAgent("")
+            self.setPersistentCookiesPolicy(QWebEngineProfile.AllowPersistentCookies)
+            self.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+    
+        self.apply_config_settings()
+
+    def apply_config_settings(self):
+        """Apply settings from config manager"""
+        if self.config_manager is None:
+            return
+        get = self.config_manager.get
+
+        download_dir = get("download_directory", "")
+        if download_dir and os.path.exists(download_dir):
+            self.setDownloadPath(download_dir)
+
+        custom_ua = get("user_agent", "")
+        if custom_ua and not self.tor_enabled:
+            self.setHttpUserAgent(custom_ua)
+
+        if not get("enable_cookies", True):
+            self.setPersistentCookiesPolicy(QWebEngineProfile.NoPersistentCookies)
+
+
+def get_tor_profile(config_manager=None, parent=None):
+    """Return the one Tor profile shared by every Tor tab, creating it on first use"""
+    global _tor_profile
+    if _tor_profile is None:
+        _tor_profile = TorWebEngineProfile(tor_enabled=True, config_manager=config_manager, parent=parent)
+    return _tor_profile
+
+
+class LazyWebView(QWebEngineView):
+    """Web view that only loads and runs its page while it is shown"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending_url = None
+
+    def defer_load(self, url):
+        """Load the url on the next event loop pass while the view is shown"""
+        self._pending_url = url
+        if self.isVisible():
+            QTimer.singleShot(0, self._load_pending)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._set_lifecycle_state(True)
+        if self._pending_url is not None:
+            QTimer.singleShot(0, self._load_pending)
+
+    def _load_pending(self):
+        if self._pending_url is not None and self.isVisible():
+            url, self._pending_url = self._pending_url, None
+            self.load(url)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._set_lifecycle_state(False)
+
+    def blank(self):
+        """Reset the view to an empty page so it can be pooled"""
+        self._pending_url = None
+        # A frozen page cannot navigate; it was frozen when it was hidden
+        self._set_lifecycle_state(True)
+        self.stop()
+        self.setUrl(QUrl("about:blank"))
+        self.history().clear()
+
+    def _set_lifecycle_state(self, active):
+        # LifecycleState (Qt 5.14+) is a scoped enum; its members are not
+        # attributes of QWebEnginePage itself
+        if hasattr(QWebEnginePage, 'LifecycleState'):
+            states = QWebEnginePage.LifecycleState
+            self.page().setLifecycleState(states.Active if active else states.Frozen)